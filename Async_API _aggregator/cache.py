@@ -1,5 +1,51 @@
 # cache.py
-from cachetools import TTLCache
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+class TTLDict:
+    """Dict-backed TTL cache: reads are one dict lookup plus a timestamp compare,
+    expired entries are dropped lazily on read and by a periodic sweep"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[str, Tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        # Re-insert so the dict stays ordered oldest-first for eviction
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def sweep(self) -> None:
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self._data.items() if expires_at < now]
+        for k in expired:
+            del self._data[k]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+async def sweep_forever(cache: TTLDict, interval: float = 30.0) -> None:
+    """Background task that evicts expired entries every `interval` seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        cache.sweep()
 
 # Initialize cache with 5-minute TTL
-cache = TTLCache(maxsize=100, ttl=300)
\ No newline at end of file
+cache = TTLDict(maxsize=100, ttl=300)
@@ -1,21 +1,35 @@
 # clients.py
-import httpx
+import aiohttp
+import orjson
 from typing import Dict, Any
 
+def create_session() -> aiohttp.ClientSession:
+    """Build the shared aiohttp session used by every upstream client"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=50,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+        ),
+        timeout=aiohttp.ClientTimeout(total=5.0),
+    )
+
 class APIClient:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: aiohttp.ClientSession):
         self.base_url = base_url
+        # Session is owned by the app lifespan and shared across clients
+        self._session = session
 
     async def get(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(f"{self.base_url}{endpoint}", params=params)
+        try:
+            async with self._session.get(f"{self.base_url}{endpoint}", params=params) as response:
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                return {"error": str(e), "status": e.response.status_code}
-            except Exception as e:
-                return {"error": str(e)}
+                return await response.json(loads=orjson.loads)
+        except aiohttp.ClientResponseError as e:
+            return {"error": str(e), "status": e.status}
+        except Exception as e:
+            return {"error": str(e)}
 
-weather_client = APIClient("https://api.openweathermap.org/data/2.5")
-news_client = APIClient("https://newsapi.org/v2")
\ No newline at end of file
+WEATHER_API_URL = "https://api.openweathermap.org/data/2.5"
+NEWS_API_URL = "https://newsapi.org/v2"
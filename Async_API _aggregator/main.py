@@ -1,8 +1,35 @@
 # main.py
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from cache import cache, sweep_forever
+from clients import APIClient, create_session, WEATHER_API_URL, NEWS_API_URL
 from routers.aggregate import router as aggregate_router
 
-app = FastAPI(title="Async API Aggregator")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared upstream clients on startup and close them on shutdown"""
+    session = create_session()
+    app.state.weather_client = APIClient(WEATHER_API_URL, session)
+    app.state.news_client = APIClient(NEWS_API_URL, session)
+    sweeper = asyncio.create_task(sweep_forever(cache))
+    # /api/status payload, built once at startup instead of per request
+    app.state.status = {
+        "status": "running",
+        "framework": "FastAPI",
+        "features": ["Async Aggregation", "TTL Caching"],
+        "docs": "/docs"
+    }
+    yield
+    sweeper.cancel()
+    await session.close()
+
+app = FastAPI(
+    title="Async API Aggregator",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Register the aggregate router
 app.include_router(aggregate_router)
@@ -12,10 +39,16 @@ def root():
     return {"message": "Hello, FastAPI! Async API Aggregator is ready."}
 
 @app.get("/api/status")
-def status():
-    return {
-        "status": "running",
-        "framework": "FastAPI",
-        "features": ["Async Aggregation", "TTL Caching"],
-        "docs": "/docs"
-    }
\ No newline at end of file
+def status(request: Request):
+    return request.app.state.status
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        reload=False
+    )
@@ -1,13 +1,25 @@
 # routers/aggregate.py
 import asyncio
 import time
-from fastapi import APIRouter, Response
-from clients import weather_client, news_client
+from fastapi import APIRouter, Request, Response
+from clients import APIClient
 from cache import cache
 
 router = APIRouter(prefix="/aggregate", tags=["aggregation"])
 
-async def fetch_weather(city: str) -> dict:
+# Upper bound on each upstream fetch; stragglers are reported instead of awaited
+FETCH_TIMEOUT = 2.0
+
+async def fetch_with_timeout(source: str, coro) -> dict:
+    try:
+        async with asyncio.timeout(FETCH_TIMEOUT):
+            return await coro
+    except TimeoutError:
+        return {"source": source, "status": "timeout", "data": None}
+    except Exception as e:
+        return {"source": source, "status": "error", "error": str(e), "data": None}
+
+async def fetch_weather(weather_client: APIClient, city: str) -> dict:
     # Note: Requires a real API key in production
     data = await weather_client.get("/weather", {"q": city, "appid": "KEY"})
     if "error" in data:
@@ -41,23 +53,25 @@ async def fetch_news(city: str) -> dict:
     }
 
 @router.get("/{city}")
-async def aggregate(city: str, response: Response, no_cache: bool = False):
+async def aggregate(city: str, request: Request, response: Response, no_cache: bool = False):
     cache_key = f"aggregate:{city.lower()}"
     
-    if not no_cache and cache_key in cache:
+    cached = None if no_cache else cache.get(cache_key)
+    if cached is not None:
         response.headers["X-Cache"] = "HIT"
-        return cache[cache_key]
+        return cached
     
     response.headers["X-Cache"] = "MISS"
     
     start = time.perf_counter()
     
-    # Concurrent execution using asyncio.gather
-    results = await asyncio.gather(
-        fetch_weather(city),
-        fetch_news(city),
-        return_exceptions=True
-    )
+    # Concurrent execution; each fetch is bounded and never fails the group
+    async with asyncio.TaskGroup() as tg:
+        weather_task = tg.create_task(
+            fetch_with_timeout("weather", fetch_weather(request.app.state.weather_client, city))
+        )
+        news_task = tg.create_task(fetch_with_timeout("news", fetch_news(city)))
+    results = [weather_task.result(), news_task.result()]
     
     elapsed = time.perf_counter() - start
     
@@ -68,7 +82,9 @@ async def aggregate(city: str, response: Response, no_cache: bool = False):
         "sources_ok": sum(1 for r in results if isinstance(r, dict) and r.get("status") in ["ok", "simulated"])
     }
     
-    cache[cache_key] = data
+    # Don't pin timed-out or failed sources in the cache for the full TTL
+    if data["sources_ok"] == len(results):
+        cache.set(cache_key, data)
     return data
 
 @router.delete("/cache")
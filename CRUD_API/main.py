@@ -1,14 +1,28 @@
 # main.py
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from database import init_db
 from routes.tasks import router as tasks_router
 
-app = FastAPI(title="CRUD API with Pydantic & SQLAlchemy")
-
-@app.on_event("startup")
-async def startup_event():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """Initialize the database when the application starts"""
     await init_db()
+    # /api/status never changes, so construct its dict once at startup
+    app.state.status = {
+        "status": "running",
+        "framework": "FastAPI",
+        "database": "SQLite (Async)",
+        "docs": "/docs"
+    }
+    yield
+
+app = FastAPI(
+    title="CRUD API with Pydantic & SQLAlchemy",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Include the tasks router
 app.include_router(tasks_router)
@@ -18,10 +32,16 @@ def root():
     return {"message": "Hello teja! The CRUD API is running and connected to the database."}
 
 @app.get("/api/status")
-def status():
-    return {
-        "status": "running",
-        "framework": "FastAPI",
-        "database": "SQLite (Async)",
-        "docs": "/docs"
-    }
\ No newline at end of file
+def status(request: Request):
+    return request.app.state.status
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        reload=False
+    )
@@ -1,14 +1,22 @@
 # routes/tasks.py
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, func, lambda_stmt, literal_column
 from typing import Optional
 
 from database import get_db, Task
-from schemas import TaskCreate, TaskUpdate, TaskResponse, TaskList, Priority
+from schemas import TaskCreate, TaskUpdate, TaskResponse, TaskList, Priority, TASK_LIST_ADAPTER
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Upper bound on rows accepted by POST /tasks/bulk
+MAX_BULK_TASKS = 100
+
+def task_by_id(task_id: int):
+    """Cached lookup-by-id statement; task_id is bound as a parameter"""
+    return lambda_stmt(lambda: select(Task).where(Task.id == task_id))
+
 @router.get("/", response_model=TaskList)
 async def list_tasks(
     page: int = Query(1, ge=1),
@@ -26,16 +34,33 @@ async def list_tasks(
     if priority:
         query = query.where(Task.priority == priority)
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    # Fetch the page and the total match count in a single round-trip
+    paged_query = (
+        query.add_columns(func.count().over().label("total"))
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    rows = (await db.execute(paged_query)).all()
+    tasks = [row[0] for row in rows]
     
-    # Apply pagination
-    query = query.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(query)
-    tasks = result.scalars().all()
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the last page there are no rows to carry the count
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar()
+    else:
+        total = 0
     
-    return TaskList(tasks=tasks, total=total, page=page, per_page=per_page)
+    # Serialize through the prebuilt adapter and skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
+        "tasks": TASK_LIST_ADAPTER.dump_python(
+            TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
+        ),
+        "total": total,
+        "page": page,
+        "per_page": per_page
+    })
 
 @router.post("/", response_model=TaskResponse, status_code=201)
 async def create_task(
@@ -46,16 +71,44 @@ async def create_task(
     task = Task(**task_data.model_dump())
     db.add(task)
     await db.commit()
-    await db.refresh(task)
     return task
 
+@router.post("/bulk", response_model=list[TaskResponse], status_code=201)
+async def create_tasks_bulk(
+    tasks_data: list[TaskCreate] = Body(..., min_length=1, max_length=MAX_BULK_TASKS),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create several tasks in one request"""
+    # Core executemany: aiomysql rewrites it into one multi-row INSERT ... VALUES
+    result = await db.execute(
+        insert(Task.__table__),
+        [task_data.model_dump() for task_data in tasks_data]
+    )
+    # MySQL reports the first id of a multi-row INSERT and allocates the
+    # batch's ids as one block spaced by auto_increment_increment, so the new
+    # rows are exactly first_id + k * step for k < n; read them back in one SELECT
+    first_id = result.lastrowid
+    step = literal_column("@@auto_increment_increment")
+    rows = await db.execute(
+        select(Task)
+        .where(
+            Task.id >= first_id,
+            Task.id <= first_id + (len(tasks_data) - 1) * step,
+            (Task.id - first_id) % step == 0
+        )
+        .order_by(Task.id)
+    )
+    tasks = rows.scalars().all()
+    await db.commit()
+    return tasks
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
     db: AsyncSession = Depends(get_db)
 ):
     """Get a single task by ID"""
-    result = await db.execute(select(Task).where(Task.id == task_id))
+    result = await db.execute(task_by_id(task_id))
     task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -68,7 +121,7 @@ async def update_task(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing task"""
-    result = await db.execute(select(Task).where(Task.id == task_id))
+    result = await db.execute(task_by_id(task_id))
     task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -87,7 +140,7 @@ async def delete_task(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a task"""
-    result = await db.execute(select(Task).where(Task.id == task_id))
+    result = await db.execute(task_by_id(task_id))
     task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -1,5 +1,5 @@
 # schemas.py
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -15,11 +15,13 @@ class TaskBase(BaseModel):
     description: Optional[str] = Field(None, max_length=500)
     priority: Priority = Priority.medium
     
-    @validator('title')
-    def title_must_not_be_empty(cls, v):
-        if not v.strip():
+    @field_validator('title')
+    @classmethod
+    def title_must_not_be_empty(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
             raise ValueError('Title cannot be empty or whitespace')
-        return v.strip()
+        return v
 
 class TaskCreate(TaskBase):
     """Schema for creating a new task"""
@@ -47,4 +49,7 @@ class TaskList(BaseModel):
     tasks: list[TaskResponse]
     total: int
     page: int
-    per_page: int
\ No newline at end of file
+    per_page: int
+
+# Built once at import; validates ORM rows and dumps them without a per-request schema lookup
+TASK_LIST_ADAPTER = TypeAdapter(list[TaskResponse])
\ No newline at end of file
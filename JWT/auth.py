@@ -1,14 +1,16 @@
 # auth.py
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 
 SECRET_KEY = "your-secret-key-change-in-production"
 ALGORITHM = "HS256"
+# Encode the key once at import instead of on every sign/verify
+SIGNING_KEY = SECRET_KEY.encode()
 ACCESS_TOKEN_EXPIRE = timedelta(minutes=30)
 REFRESH_TOKEN_EXPIRE = timedelta(days=7)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=10, deprecated="auto")
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -19,7 +21,7 @@ def verify_password(plain: str, hashed: str) -> bool:
 def create_token(data: dict, expires_delta: timedelta) -> str:
     to_encode = data.copy()
     to_encode["exp"] = datetime.utcnow() + expires_delta
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
 
 def create_access_token(user_id: int) -> str:
     return create_token(
@@ -35,7 +37,12 @@ def create_refresh_token(user_id: int) -> str:
 
 def decode_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token,
+            SIGNING_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "sub"]}
+        )
         return payload
-    except JWTError:
+    except jwt.InvalidTokenError:
         return None
@@ -1,7 +1,9 @@
 # database.py
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, DateTime, ForeignKey
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.mysql import TINYINT
 from datetime import datetime
 import enum
 import os
@@ -15,15 +17,59 @@ DB_NAME = os.getenv("DB_NAME", "tasks_db")
 
 DATABASE_URL = f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+# SQL echo is opt-in; logging every statement serializes the hot path
+SQL_DEBUG = os.getenv("SQL_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Pool limits are per worker process: workers x (size + overflow) must stay
+# below MySQL's max_connections (151 by default)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=SQL_DEBUG,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
+    pool_pre_ping=False,
+    pool_use_lifo=True
+)
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
+def utcnow_seconds() -> datetime:
+    """Current UTC time truncated to the second, matching MySQL DATETIME precision,
+    so the value held in memory after INSERT equals what a later SELECT returns"""
+    return datetime.utcnow().replace(microsecond=0)
+
 class PriorityEnum(enum.Enum):
     low = "low"
     medium = "medium"
     high = "high"
 
+PRIORITY_TO_INT = {"low": 1, "medium": 2, "high": 3}
+INT_TO_PRIORITY = {v: PriorityEnum(k) for k, v in PRIORITY_TO_INT.items()}
+
+class PriorityType(TypeDecorator):
+    """Stores PriorityEnum as a small integer (1-byte TINYINT on MySQL); accepts enum members or their string values"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(TINYINT())
+        return dialect.type_descriptor(SmallInteger())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return PRIORITY_TO_INT[getattr(value, "value", value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return INT_TO_PRIORITY[value]
+
 class User(Base):
     __tablename__ = "users"
     
@@ -31,7 +77,7 @@ class User(Base):
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow_seconds)
 
 class Task(Base):
     __tablename__ = "tasks"
@@ -39,11 +85,11 @@ class Task(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), nullable=False)
     description = Column(String(500), nullable=True)
-    priority = Column(Enum(PriorityEnum), default=PriorityEnum.medium)
+    priority = Column(PriorityType, index=True, default=PriorityEnum.medium)
     completed = Column(Boolean, default=False)
     owner_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow_seconds)
+    updated_at = Column(DateTime, default=utcnow_seconds, onupdate=utcnow_seconds)
 
 async def get_db():
     async with async_session() as session:
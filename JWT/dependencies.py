@@ -2,7 +2,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 
 from database import get_db, User
 from auth import decode_token
@@ -27,7 +27,8 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
         
-    result = await db.execute(select(User).where(User.id == int(user_id)))
+    user_pk = int(user_id)
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_pk)))
     user = result.scalar_one_or_none()
     
     if user is None:
@@ -1,15 +1,30 @@
 # main.py
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from database import init_db
 from routes.auth import router as auth_router
 from routes.tasks import router as tasks_router
 
-app = FastAPI(title="JWT Authentication API")
-
-@app.on_event("startup")
-async def startup_event():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """Initialize the database and create tables"""
     await init_db()
+    # Build the static /api/status dict once here rather than on each call
+    app.state.status = {
+        "status": "running",
+        "framework": "FastAPI",
+        "database": "MySQL (Async)",
+        "auth": "JWT",
+        "docs": "/docs"
+    }
+    yield
+
+app = FastAPI(
+    title="JWT Authentication API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Register Routers
 app.include_router(auth_router)
@@ -20,11 +35,16 @@ def root():
     return {"message": "Hello teja! The JWT Authentication API is running."}
 
 @app.get("/api/status")
-def status():
-    return {
-        "status": "running",
-        "framework": "FastAPI",
-        "database": "MySQL (Async)",
-        "auth": "JWT",
-        "docs": "/docs"
-    }
\ No newline at end of file
+def status(request: Request):
+    return request.app.state.status
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        reload=False
+    )
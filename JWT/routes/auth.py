@@ -1,8 +1,10 @@
 # routes/auth.py
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_, lambda_stmt
+from sqlalchemy.exc import IntegrityError
 
 from database import get_db, User
 from schemas import UserCreate, UserResponse, TokenResponse
@@ -13,24 +15,35 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 
 @router.post("/register", response_model=UserResponse, status_code=201)
 async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    if result.scalar_one_or_none():
+    # Check if user already exists (email and username in one query); the
+    # flags are computed in SQL so the column collation decides equality
+    result = await db.execute(
+        select(
+            (User.email == user_data.email).label("email_taken"),
+            (User.username == user_data.username).label("username_taken")
+        ).where(
+            or_(User.email == user_data.email, User.username == user_data.username)
+        )
+    )
+    existing = result.all()
+    if any(row.email_taken for row in existing):
         raise HTTPException(status_code=409, detail="Email already registered")
-    
-    result = await db.execute(select(User).where(User.username == user_data.username))
-    if result.scalar_one_or_none():
+    if any(row.username_taken for row in existing):
         raise HTTPException(status_code=409, detail="Username already taken")
     
     # Create user
     user = User(
         email=user_data.email,
         username=user_data.username,
-        password_hash=hash_password(user_data.password)
+        password_hash=await asyncio.to_thread(hash_password, user_data.password)
     )
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent registration took the email or username after the check
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Email or username already registered")
     return user
 
 @router.post("/login", response_model=TokenResponse)
@@ -39,10 +52,12 @@ async def login(
     db: AsyncSession = Depends(get_db)
 ):
     # Authenticate user (using email as username for OAuth2 form)
-    result = await db.execute(select(User).where(User.email == form_data.username))
+    email = form_data.username
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.email == email)))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    # bcrypt is CPU-bound, so run it off the event loop
+    if not user or not await asyncio.to_thread(verify_password, form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -1,7 +1,7 @@
 # routes/tasks.py
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, func
 from typing import Optional
 
 from database import get_db, Task, User
@@ -10,6 +10,9 @@ from dependencies import get_current_user
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Upper bound on rows accepted by POST /tasks/bulk
+MAX_BULK_TASKS = 100
+
 @router.get("/", response_model=TaskList)
 async def list_tasks(
     page: int = Query(1, ge=1),
@@ -20,14 +23,23 @@ async def list_tasks(
     """List tasks for the current user"""
     query = select(Task).where(Task.owner_id == current_user.id)
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    # Fetch the page and the total match count in a single round-trip
+    paged_query = (
+        query.add_columns(func.count().over().label("total"))
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    rows = (await db.execute(paged_query)).all()
+    tasks = [row[0] for row in rows]
     
-    # Apply pagination
-    query = query.offset((page - 1) * per_page).limit(per_page)
-    result = await db.execute(query)
-    tasks = result.scalars().all()
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the last page there are no rows to carry the count
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar()
+    else:
+        total = 0
     
     return TaskList(tasks=tasks, total=total, page=page, per_page=per_page)
 
@@ -44,5 +56,30 @@ async def create_task(
     )
     db.add(task)
     await db.commit()
-    await db.refresh(task)
     return task
+
+
+@router.post("/bulk", response_model=list[TaskResponse], status_code=201)
+async def create_tasks_bulk(
+    tasks_data: list[TaskCreate] = Body(..., min_length=1, max_length=MAX_BULK_TASKS),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Create several tasks for the current user in one request"""
+    # Core executemany: aiomysql rewrites it into one multi-row INSERT ... VALUES
+    result = await db.execute(
+        insert(Task.__table__),
+        [{**task_data.model_dump(), "owner_id": current_user.id} for task_data in tasks_data]
+    )
+    # MySQL reports the first id of a multi-row INSERT and allocates the
+    # batch's ids as one block, so the new rows are read back in one SELECT
+    first_id = result.lastrowid
+    rows = await db.execute(
+        select(Task)
+        .where(Task.owner_id == current_user.id, Task.id >= first_id)
+        .order_by(Task.id)
+        .limit(len(tasks_data))
+    )
+    tasks = rows.scalars().all()
+    await db.commit()
+    return tasks
\ No newline at end of file
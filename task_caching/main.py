@@ -1,6 +1,7 @@
-import uuid
+import time
 from datetime import datetime
 from fastapi import FastAPI, BackgroundTasks, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from tasks import router as tasks_router, TaskStatus, task_store
 from routes.admin import router as admin_router
@@ -9,7 +10,8 @@ from routes.admin import router as admin_router
 app = FastAPI(
     title="Task Caching API",
     description="FastAPI application with background task management and caching",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -21,6 +23,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Health timestamp, reformatted at most once per second
+_cached_ts: tuple[int, str] = (0, "")
+
+def current_timestamp() -> str:
+    global _cached_ts
+    now = int(time.time())
+    if now != _cached_ts[0]:
+        _cached_ts = (now, datetime.utcfromtimestamp(now).isoformat())
+    return _cached_ts[1]
+
 # Include routers
 app.include_router(tasks_router, prefix="/api", tags=["Tasks"])
 app.include_router(admin_router, prefix="/api", tags=["Admin"])
@@ -43,15 +55,21 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": current_timestamp(),
         "active_tasks": len(task_store)
     }
 
 if __name__ == "__main__":
+    import os
     import uvicorn
+    # task_store is per-process, so extra workers are opt-in via WEB_CONCURRENCY
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="auto",
+        http="httptools",
+        reload=False,
+        access_log=False
     )
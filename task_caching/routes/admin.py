@@ -1,25 +1,27 @@
+import heapq
 from fastapi import APIRouter
-from tasks import task_store, TaskStatus
+from tasks import task_store, status_index
 
 # Create router
 router = APIRouter()
 
 
+def count_by_status() -> dict:
+    """Per-status task counts, read straight from the status index"""
+    return {status: len(ids) for status, ids in status_index.items()}
+
+
 @router.get("/admin/dashboard")
 async def admin_dashboard():
     """Get admin dashboard with task and cache statistics"""
     tasks = list(task_store.values())
-    task_stats = {
-        "total": len(tasks),
-        "pending": sum(1 for t in tasks if t["status"] == TaskStatus.PENDING),
-        "running": sum(1 for t in tasks if t["status"] == TaskStatus.RUNNING),
-        "completed": sum(1 for t in tasks if t["status"] == TaskStatus.COMPLETED),
-        "failed": sum(1 for t in tasks if t["status"] == TaskStatus.FAILED),
-    }
+    task_stats = {"total": len(tasks), **count_by_status()}
     
     return {
         "tasks": task_stats,
-        "recent_tasks": sorted(tasks, key=lambda t: t.get("created_at", ""), reverse=True)[:10]
+        "recent_tasks": [
+            t.to_dict() for t in heapq.nlargest(10, tasks, key=lambda t: t.created_at)
+        ]
     }
 
 
@@ -29,11 +31,6 @@ async def tasks_summary():
     tasks = list(task_store.values())
     return {
         "total_tasks": len(tasks),
-        "status_breakdown": {
-            "pending": sum(1 for t in tasks if t["status"] == TaskStatus.PENDING),
-            "running": sum(1 for t in tasks if t["status"] == TaskStatus.RUNNING),
-            "completed": sum(1 for t in tasks if t["status"] == TaskStatus.COMPLETED),
-            "failed": sum(1 for t in tasks if t["status"] == TaskStatus.FAILED),
-        },
-        "tasks": tasks
+        "status_breakdown": count_by_status(),
+        "tasks": [t.to_dict() for t in tasks]
     }
@@ -1,14 +1,15 @@
-import uuid
+import secrets
+import time
 import asyncio
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from cachetools import TTLCache
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 
 # Create router
 router = APIRouter()
 
-# In-memory task store
-task_store: dict = {}
-
 class TaskStatus:
     PENDING = "pending"
     RUNNING = "running"
@@ -16,36 +17,116 @@ class TaskStatus:
     FAILED = "failed"
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def format_ns(ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() value as a UTC ISO-8601 string"""
+    if ns is None:
+        return None
+    # Integer math keeps microseconds exact; a float of ~1.8e18 ns does not
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    id: str
+    type: str
+    status: str
+    # Timestamps are raw time.time_ns() ints, formatted only when serialized
+    created_at: int
+    started_at: Optional[int] = None
+    finished_at: Optional[int] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "status": self.status,
+            "created_at": format_ns(self.created_at),
+            "started_at": format_ns(self.started_at),
+            "finished_at": format_ns(self.finished_at),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+# Task ids grouped by status, so per-status counts are O(1)
+status_index: dict[str, set[str]] = {
+    TaskStatus.PENDING: set(),
+    TaskStatus.RUNNING: set(),
+    TaskStatus.COMPLETED: set(),
+    TaskStatus.FAILED: set(),
+}
+
+
+def _unindex(task_id: str) -> None:
+    for ids in status_index.values():
+        ids.discard(task_id)
+
+
+class TaskStore(TTLCache):
+    """TTLCache that drops evicted and expired tasks from status_index"""
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        _unindex(key)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            _unindex(key)
+        return expired
+
+
+# In-memory task store, bounded and expiring after an hour
+task_store: TaskStore = TaskStore(maxsize=10_000, ttl=3600)
+
+
+def set_status(task: TaskRecord, status: str) -> None:
+    """Move a task to a new status and keep status_index in step"""
+    status_index[task.status].discard(task.id)
+    task.status = status
+    # A record evicted mid-run must not be re-indexed
+    if task.id in task_store:
+        status_index[status].add(task.id)
+
+
 async def generate_report(task_id: str, params: dict):
     """Simulate a long-running report generation."""
-    task_store[task_id]["status"] = TaskStatus.RUNNING
-    task_store[task_id]["started_at"] = datetime.utcnow().isoformat()
+    # Hold the record itself so an eviction mid-run doesn't break the update
+    task = task_store[task_id]
+    set_status(task, TaskStatus.RUNNING)
+    task.started_at = time.time_ns()
     
     try:
         await asyncio.sleep(3)  # Simulate processing (reduced for demo)
         
-        task_store[task_id]["status"] = TaskStatus.COMPLETED
-        task_store[task_id]["result"] = {
+        set_status(task, TaskStatus.COMPLETED)
+        task.result = {
             "report_url": f"/reports/{task_id}.pdf",
             "rows_processed": 15000
         }
     except Exception as e:
-        task_store[task_id]["status"] = TaskStatus.FAILED
-        task_store[task_id]["error"] = str(e)
+        set_status(task, TaskStatus.FAILED)
+        task.error = str(e)
     
-    task_store[task_id]["finished_at"] = datetime.utcnow().isoformat()
+    task.finished_at = time.time_ns()
 
 
 @router.post("/tasks/report")
 async def create_report(params: dict, background_tasks: BackgroundTasks):
     """Create a new report generation task"""
-    task_id = str(uuid.uuid4())
-    task_store[task_id] = {
-        "id": task_id,
-        "type": "report",
-        "status": TaskStatus.PENDING,
-        "created_at": datetime.utcnow().isoformat()
-    }
+    task_id = secrets.token_hex(16)
+    task_store[task_id] = TaskRecord(
+        id=task_id,
+        type="report",
+        status=TaskStatus.PENDING,
+        created_at=time.time_ns()
+    )
+    status_index[TaskStatus.PENDING].add(task_id)
     background_tasks.add_task(generate_report, task_id, params)
     return {"task_id": task_id, "status": "pending"}
 
@@ -55,7 +136,7 @@ async def get_task_status(task_id: str):
     """Get the status of a specific task"""
     if task_id not in task_store:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task_store[task_id]
+    return task_store[task_id].to_dict()
 
 
 @router.get("/tasks")
@@ -63,5 +144,5 @@ async def list_tasks():
     """List all tasks"""
     return {
         "total": len(task_store),
-        "tasks": list(task_store.values())
+        "tasks": [t.to_dict() for t in task_store.values()]
     }
\ No newline at end of file